@@ -3,19 +3,23 @@
 # Import data structures and functions for handling current profile data in electrochemical simulations.
 from pyecn.I_Profile_Loader.current_profile import (
     ProfileData,
+    ProfileEvaluator,
     build_time_grid,
     interpolate_profile,
     load_current_profile,
     load_profile_csv,
-    load_current_profile_with_t_end
+    load_current_profile_with_t_end,
+    resolve_profile_path
 )
 
 # Define the public API exposed by this module.
 __all__ = [
     "ProfileData",
+    "ProfileEvaluator",
     "build_time_grid",
     "interpolate_profile",
     "load_current_profile",
     "load_profile_csv",
-    "load_current_profile_with_t_end"
+    "load_current_profile_with_t_end",
+    "resolve_profile_path"
 ]
\ No newline at end of file
@@ -2,12 +2,22 @@
 
 from __future__ import annotations
 
-import csv
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import List
 
 import numpy as np
+import pandas as pd
+
+try:  # numba is optional; interpolation falls back to np.interp without it
+    from numba import njit, prange
+
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+# Directories searched, in order, for relative profile paths
+PROFILE_SEARCH_PATHS = (Path("."), Path("pyecn/Examples/Profiles"))
 
 
 @dataclass(frozen=True)
@@ -17,9 +27,43 @@ class ProfileData:
     Attributes:
         times_s: Time points in seconds
         currents_a: Current values in amperes (positive=discharge, negative=charge)
+        packed: Interleaved (N, 2) samples, float32 when that is lossless;
+                times_s and currents_a are column views of this buffer
     """
     times_s: np.ndarray
     currents_a: np.ndarray
+    packed: np.ndarray = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Pack the samples and rebind times_s and currents_a as its columns."""
+        packed = _pack_profile(self.times_s, self.currents_a)
+        object.__setattr__(self, "packed", packed)
+        object.__setattr__(self, "times_s", packed[:, 0])
+        object.__setattr__(self, "currents_a", packed[:, 1])
+
+
+def _pack_profile(times_s: np.ndarray, currents_a: np.ndarray) -> np.ndarray:
+    """Interleave time and current samples into one (N, 2) array.
+    
+    Each interpolation segment then reads two adjacent rows instead of four
+    values from two separate arrays. Samples are stored as float32, halving
+    memory traffic, only when the downcast loses nothing; otherwise float64
+    is kept so results are unchanged.
+    
+    Args:
+        times_s: Time points in seconds
+        currents_a: Current values in amperes
+    
+    Returns:
+        Array of shape (N, 2) with column 0 = time and column 1 = current
+    """
+    packed = np.column_stack((times_s, currents_a)).astype(np.float64)
+    # Values beyond float32 range would overflow to inf and fail the check
+    with np.errstate(over="ignore"):
+        packed_32 = packed.astype(np.float32)
+    if np.array_equal(packed_32, packed):
+        return packed_32
+    return packed
 
 
 def _parse_float(value: str | None, field_name: str, row_index: int) -> float:
@@ -42,6 +86,59 @@ def _parse_float(value: str | None, field_name: str, row_index: int) -> float:
         raise ValueError(f"Row {row_index}: {field_name} is not numeric: {value}") from exc
 
 
+def _numeric_column(frame: pd.DataFrame, field_name: str) -> np.ndarray:
+    """Extract a CSV column as a float64 array.
+    
+    Columns already parsed as numbers are returned directly. Text columns are
+    coerced and the first cell that is genuinely not a number is reported
+    with its CSV row number. Any other column type (e.g. bool) is rejected.
+    
+    Args:
+        frame: Parsed CSV contents
+        field_name: Name of the CSV column to extract
+    
+    Returns:
+        Column values as a float64 array
+    
+    Raises:
+        ValueError: If any value in the column cannot be converted to float
+    """
+    column = frame[field_name]
+    if column.dtype.kind in "iuf":
+        return column.to_numpy(dtype=np.float64)
+    if column.dtype.kind != "O":
+        # Header is row 1, so the first data row is row 2
+        raise ValueError(f"Row 2: {field_name} is not numeric: {column.iat[0]}")
+
+    numeric = pd.to_numeric(column, errors="coerce")
+    for position in np.flatnonzero(numeric.isna().to_numpy()):
+        # Header is row 1, so the first data row is row 2
+        _parse_float(column.iat[position], field_name, int(position) + 2)
+    return numeric.to_numpy(dtype=np.float64)
+
+
+if _HAS_NUMBA:
+
+    @njit(cache=True)
+    def _is_monotone_kernel(values: np.ndarray) -> bool:
+        """Check ``values`` is non-decreasing, stopping at the first drop."""
+        for i in range(1, values.size):
+            if values[i] < values[i - 1]:
+                return False
+        return True
+
+
+def _is_monotone(values: np.ndarray) -> bool:
+    """Check ``values`` is non-decreasing.
+    
+    The Numba kernel stops at the first drop; without numba, shifted views
+    are compared in one vectorized pass.
+    """
+    if _HAS_NUMBA:
+        return bool(_is_monotone_kernel(values))
+    return not (values[1:] < values[:-1]).any()
+
+
 def load_profile_csv(path: Path) -> ProfileData:
     """Load and validate a current profile from CSV file.
     
@@ -64,47 +161,125 @@ def load_profile_csv(path: Path) -> ProfileData:
     if not path.exists():
         raise FileNotFoundError(f"Profile CSV not found: {path}")
 
-    with path.open(newline="") as handle:
-        reader = csv.DictReader(handle)
-        if reader.fieldnames is None:
-            raise ValueError("CSV file has no header row")
-        
-        # Check for required columns
-        required = {"t_s", "I_A"}
-        missing = required.difference(reader.fieldnames)
-        if missing:
-            raise ValueError(f"CSV missing required columns: {', '.join(sorted(missing))}")
-
-        times: List[float] = []
-        currents: List[float] = []
-        for row_index, row in enumerate(reader, start=2):
-            t_value = _parse_float(row.get("t_s"), "t_s", row_index)
-            i_value = _parse_float(row.get("I_A"), "I_A", row_index)
-            times.append(t_value)
-            currents.append(i_value)
-
-    if not times:
+    # Parse with pandas' C engine so numeric columns land directly in float64
+    # buffers; NA filtering is disabled so blank cells surface as non-numeric.
+    # Only the required columns are kept and the first column is never used
+    # as the index, so rows with extra fields are accepted with the extras
+    # ignored
+    try:
+        frame = pd.read_csv(
+            path,
+            na_filter=False,
+            index_col=False,
+            usecols=lambda name: name in {"t_s", "I_A"},
+        )
+    except pd.errors.EmptyDataError as exc:
+        raise ValueError("CSV file has no header row") from exc
+    except pd.errors.ParserError as exc:
+        raise ValueError(f"CSV is malformed: {exc}") from exc
+
+    # Check for required columns
+    required = {"t_s", "I_A"}
+    missing = required.difference(frame.columns)
+    if missing:
+        raise ValueError(f"CSV missing required columns: {', '.join(sorted(missing))}")
+
+    if frame.empty:
         raise ValueError("CSV contains no data rows")
 
-    times_arr = np.asarray(times, dtype=float)
-    currents_arr = np.asarray(currents, dtype=float)
+    times_arr = _numeric_column(frame, "t_s")
+    currents_arr = _numeric_column(frame, "I_A")
 
     # Check for NaN or infinity values
     if np.any(~np.isfinite(times_arr)) or np.any(~np.isfinite(currents_arr)):
         raise ValueError("CSV contains non-finite numeric values")
 
     # Verify time monotonicity (allow equal times for piecewise-constant profiles)
-    if np.any(np.diff(times_arr) < 0):
+    if not _is_monotone(times_arr):
         raise ValueError("t_s must be monotonically non-decreasing")
 
     return ProfileData(times_s=times_arr, currents_a=currents_arr)
 
 
-def load_current_profile(path: Path, dt: float) -> np.ndarray:
+def resolve_profile_path(
+    name: str | Path, search_paths: tuple[Path, ...] = PROFILE_SEARCH_PATHS
+) -> Path:
+    """Locate a profile CSV by searching a list of directories.
+    
+    Absolute paths are returned unchanged. Relative paths are tried against
+    each search directory in turn (the working directory first by default,
+    then the bundled example profiles).
+    
+    Args:
+        name: Profile file name or path
+        search_paths: Directories to search for relative paths
+    
+    Returns:
+        First existing candidate, or the path as given if none exists so that
+        loading reports it as missing
+    """
+    path = Path(name)
+    if path.is_absolute():
+        return path
+    for directory in search_paths:
+        candidate = directory / path
+        if candidate.exists():
+            return candidate
+    return path
+
+
+def _profile_cache_key(path: Path) -> tuple[str, int]:
+    """Build a cache key that changes whenever the profile file is modified.
+    
+    Args:
+        path: Path to CSV profile file
+    
+    Returns:
+        Resolved path string and modification time in nanoseconds
+    
+    Raises:
+        FileNotFoundError: If profile file does not exist
+    """
+    resolved = path.resolve()
+    try:
+        mtime_ns = resolved.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Profile CSV not found: {path}") from None
+    return str(resolved), mtime_ns
+
+
+@lru_cache(maxsize=16)
+def _cached_profile(resolved_path: str, mtime_ns: int) -> ProfileData:
+    """Parse a profile CSV once per file version.
+    
+    The modification time is only part of the cache key; it makes edited
+    files miss the cache. Returned arrays are read-only because they are
+    shared between callers.
+    """
+    profile = load_profile_csv(Path(resolved_path))
+    profile.times_s.flags.writeable = False
+    profile.currents_a.flags.writeable = False
+    profile.packed.flags.writeable = False
+    return profile
+
+
+@lru_cache(maxsize=16)
+def _cached_evaluator(resolved_path: str, mtime_ns: int, dt: float) -> ProfileEvaluator:
+    """Precompute a cached profile on the solver grid once per (file version, dt).
+    
+    Kept separate from _cached_profile so a new dt only repeats the
+    interpolation, not the CSV parse. Any t_end is then served as a slice.
+    """
+    return ProfileEvaluator(_cached_profile(resolved_path, mtime_ns), dt)
+
+
+def load_current_profile(path: str | Path, dt: float) -> np.ndarray:
     """Load CSV profile and interpolate to solver time steps.
     
     Reads a current profile from CSV, determines simulation end time from the
     profile data, and returns current values interpolated at uniform time steps.
+    Relative paths are located with resolve_profile_path. Results are cached
+    per file version and dt, so the returned array is read-only.
     
     Args:
         path: Path to CSV profile file
@@ -117,15 +292,19 @@ def load_current_profile(path: Path, dt: float) -> np.ndarray:
         FileNotFoundError: If profile file does not exist
         ValueError: If profile is invalid or interpolation fails
     """
-    profile = load_profile_csv(path)
-    t_end = profile.times_s[-1]
-    time_grid = build_time_grid(dt, t_end)
-    return interpolate_profile(profile, time_grid)
+    key = _profile_cache_key(resolve_profile_path(path))
+    return _cached_evaluator(*key, dt).currents
 
 
-def load_current_profile_with_t_end(path: Path, dt: float, t_end: float | None) -> np.ndarray:
+def load_current_profile_with_t_end(
+    path: str | Path, dt: float, t_end: float | None
+) -> np.ndarray:
     """Load CSV profile and interpolate to solver time steps with optional t_end override.
 
+    Paths are located and results cached like load_current_profile; changing
+    t_end only slices the cached currents, so the returned array is a
+    read-only view.
+
     Args:
         path: Path to CSV profile file
         dt: Time step size in seconds (from solver configuration)
@@ -138,18 +317,31 @@ def load_current_profile_with_t_end(path: Path, dt: float, t_end: float | None)
         FileNotFoundError: If profile file does not exist
         ValueError: If profile is invalid or interpolation fails
     """
-    if t_end is None:
-        return load_current_profile(path, dt)
-    profile = load_profile_csv(path)
-    time_grid = build_time_grid(dt, t_end)
-    return interpolate_profile(profile, time_grid)
+    key = _profile_cache_key(resolve_profile_path(path))
+    return _cached_evaluator(*key, dt).currents_until(t_end)
+
+
+def _step_count(dt: float, t_end: float) -> int:
+    """Return the number of whole dt steps that fit in t_end.
+    
+    A ratio within rounding error of an integer is snapped to it, so that
+    e.g. t_end=0.3 and dt=0.1 give 3 steps although 0.3 / 0.1 evaluates
+    to 2.9999999999999996.
+    """
+    ratio = t_end / dt
+    nearest = round(ratio)
+    if abs(ratio - nearest) <= 1e-9 * max(1.0, nearest):
+        return int(nearest)
+    return int(np.floor(ratio))
 
 
 def build_time_grid(dt: float, t_end: float) -> np.ndarray:
     """Generate uniform time grid for solver integration.
     
-    Creates an array of time points from 0 to t_end with spacing dt.
-    The grid may extend slightly beyond t_end to ensure complete coverage.
+    Creates an array of time points from 0 to the last whole step at or
+    before t_end with spacing dt. Points are computed directly rather than by
+    repeated addition, and t_end / dt values within rounding error of an
+    integer count as that many whole steps.
     
     Args:
         dt: Time step size in seconds
@@ -165,8 +357,57 @@ def build_time_grid(dt: float, t_end: float) -> np.ndarray:
         raise ValueError("dt must be positive")
     if t_end <= 0:
         raise ValueError("t_end must be positive")
-    steps = int(np.floor(t_end / dt))
-    return np.arange(0.0, steps * dt + dt, dt)
+    steps = _step_count(dt, t_end)
+    # Rounding in steps * dt must not push the final point past t_end
+    return np.linspace(0.0, min(steps * dt, t_end), steps + 1, dtype=np.float64)
+
+
+def _check_time_grid(profile: ProfileData, time_grid: np.ndarray) -> None:
+    """Verify a time grid is non-empty and lies within the profile range.
+    
+    Args:
+        profile: Profile data containing time and current arrays
+        time_grid: Target time points for interpolation
+    
+    Raises:
+        ValueError: If time_grid is empty or extends outside profile range
+    """
+    if time_grid.size == 0:
+        raise ValueError("time_grid must not be empty")
+
+    if time_grid[0] < profile.times_s[0]:
+        raise ValueError("time_grid starts before profile t_s range")
+    if time_grid[-1] > profile.times_s[-1]:
+        raise ValueError("time_grid ends after profile t_s range")
+
+
+if _HAS_NUMBA:
+
+    @njit(parallel=True, cache=True)
+    def _interp_sorted(x: np.ndarray, packed: np.ndarray, out: np.ndarray) -> None:
+        """Linearly interpolate ``x`` into ``out`` (np.interp semantics).
+
+        Segments are searched in the time column of ``packed``. Points
+        outside it are clamped to the first or last current value.
+        """
+        xp = packed[:, 0]
+        last = xp.size - 1
+        for i in prange(x.size):
+            # Left segment index such that xp[j] <= x[i] < xp[j + 1]
+            j = np.searchsorted(xp, x[i], side="right") - 1
+            if j < 0:
+                out[i] = packed[0, 1]
+            elif j >= last:
+                out[i] = packed[last, 1]
+            else:
+                # Same float64 operation order as np.interp so results match
+                # bit for bit, also when packed holds float32 samples
+                t0 = np.float64(packed[j, 0])
+                i0 = np.float64(packed[j, 1])
+                slope = (np.float64(packed[j + 1, 1]) - i0) / (
+                    np.float64(packed[j + 1, 0]) - t0
+                )
+                out[i] = slope * (x[i] - t0) + i0
 
 
 def interpolate_profile(profile: ProfileData, time_grid: np.ndarray) -> np.ndarray:
@@ -174,6 +415,9 @@ def interpolate_profile(profile: ProfileData, time_grid: np.ndarray) -> np.ndarr
     
     Uses linear interpolation between profile data points. Handles
     piecewise-constant profiles (duplicate time values) correctly.
+    A parallel Numba kernel is used when numba is installed, otherwise
+    ``np.interp``; both clamp any point outside the profile range to the
+    first or last current value and produce identical results.
     
     Args:
         profile: Profile data containing time and current arrays
@@ -184,13 +428,78 @@ def interpolate_profile(profile: ProfileData, time_grid: np.ndarray) -> np.ndarr
     
     Raises:
         ValueError: If time_grid is empty or extends outside profile range
+    
+    Examples:
+        >>> profile = ProfileData(
+        ...     np.array([0.0, 0.3, 0.3, 1.7, 2.9]),
+        ...     np.array([0.1, 2.7, -1.3, 0.7, 3.3]),
+        ... )
+        >>> grid = np.linspace(0.0, 2.9, 30)
+        >>> expected = np.interp(grid, profile.times_s, profile.currents_a)
+        >>> bool(np.array_equal(interpolate_profile(profile, grid), expected))
+        True
     """
-    if time_grid.size == 0:
-        raise ValueError("time_grid must not be empty")
+    _check_time_grid(profile, time_grid)
 
-    if time_grid[0] < profile.times_s[0]:
-        raise ValueError("time_grid starts before profile t_s range")
-    if time_grid[-1] > profile.times_s[-1]:
-        raise ValueError("time_grid ends after profile t_s range")
+    if not _HAS_NUMBA:
+        return np.interp(time_grid, profile.times_s, profile.currents_a)
+
+    # The kernel indexes raw buffers, so hand it contiguous float64 arrays
+    grid = np.ascontiguousarray(time_grid, dtype=np.float64)
+    out = np.empty_like(grid)
+    _interp_sorted(grid, profile.packed, out)
+    return out
 
-    return np.interp(time_grid, profile.times_s, profile.currents_a)
\ No newline at end of file
+
+class ProfileEvaluator:
+    """Profile currents precomputed on the solver grid spanning the whole profile.
+    
+    Interpolation runs once per profile and dt through interpolate_profile;
+    any shorter simulation end time is then served as a zero-copy slice.
+    load_current_profile and load_current_profile_with_t_end both read
+    their currents from a cached evaluator, so there is a single
+    evaluation path.
+    
+    Attributes:
+        profile: Profile data the currents were computed from
+        dt: Time step size in seconds
+        currents: Read-only current values at each time step up to the profile end
+    """
+
+    def __init__(self, profile: ProfileData, dt: float) -> None:
+        """Interpolate the profile onto the full-profile time grid.
+        
+        Args:
+            profile: Profile data containing time and current arrays
+            dt: Time step size in seconds
+        
+        Raises:
+            ValueError: If dt is not positive or the profile is invalid
+        """
+        self.profile = profile
+        self.dt = dt
+        time_grid = build_time_grid(dt, float(profile.times_s[-1]))
+        self.currents = interpolate_profile(profile, time_grid)
+        self.currents.flags.writeable = False
+
+    def currents_until(self, t_end: float | None) -> np.ndarray:
+        """Return currents at each time step up to t_end.
+        
+        Args:
+            t_end: Simulation end time in seconds, or None for the profile end
+        
+        Returns:
+            Read-only view of the current values, same length as
+            build_time_grid(dt, t_end)
+        
+        Raises:
+            ValueError: If t_end is not positive or is beyond the profile range
+        """
+        if t_end is None:
+            return self.currents
+        if t_end <= 0:
+            raise ValueError("t_end must be positive")
+        steps = _step_count(self.dt, t_end)
+        if steps >= self.currents.size:
+            raise ValueError("time_grid ends after profile t_s range")
+        return self.currents[: steps + 1]
\ No newline at end of file
@@ -1,29 +1,67 @@
 # -*- coding: utf-8 -*-
 """Lightweight hook for per-step temperature access and live plotting."""
+from typing import Protocol, TypedDict, runtime_checkable
+
 import matplotlib.pyplot as plt
 import numpy as np
+from matplotlib.artist import Artist
+from matplotlib.axes import Axes
+from matplotlib.backend_bases import DrawEvent
+from matplotlib.figure import Figure
+from matplotlib.image import AxesImage
+from matplotlib.lines import Line2D
+from matplotlib.transforms import BboxBase
 import pyecn.parse_inputs as ip
 
+
+class _FigureState(TypedDict):
+    """Figure elements, grid mappings and data kept between updates."""
+    fig: Figure
+    ax_heat: Axes
+    ax_time: Axes
+    heatmap: AxesImage
+    line_avg: Line2D
+    line_max: Line2D
+    outer_ids: np.ndarray
+    ax_vals: np.ndarray
+    an_vals: np.ndarray
+    rows: np.ndarray
+    cols: np.ndarray
+    node_map: np.ndarray
+    heatmap_data: np.ndarray
+    text_grid: np.ndarray
+    animated: list[Artist]
+    background: object | None
+    time_data: list[float]
+    avg_data: list[float]
+    max_data: list[float]
+
+
+@runtime_checkable
+class _BlitCanvas(Protocol):
+    """Canvas methods needed for blitting, provided by Agg-based backends."""
+    def copy_from_bbox(self, bbox: BboxBase) -> object: ...
+    def restore_region(self, region: object) -> None: ...
+
+
 # Maintains figure state across time steps to avoid recreating plots
-_FIGURE_STATE = {}
+_FIGURE_STATE: dict[int, _FigureState] = {}
 
 def on_step(part, step: int) -> None:
     """Capture T_record at each time step and visualize in real-time."""
-    # Convert temperatures from Kelvin to Celsius for the current step
-    temps = part.T_record[:, step] - 273.15
-    
-    # Get surface node indices - these are the nodes we want to monitor
-    outer_ids = getattr(part, "ind0_Geo_surface_4T_4SepFill", [])
-    outer_ids = list(outer_ids) if outer_ids is not None else []
-    outer_temps = temps[outer_ids] if outer_ids else []
-    
     # Only update visualization every 10 steps to reduce overhead
-    if not outer_ids or step % 10 != 0:
+    if step % 10 != 0:
         return
     
     fig_state = _FIGURE_STATE.get(id(part))
     
     if fig_state is None:
+        # Get surface node indices - these are the nodes we want to monitor
+        outer_ids = getattr(part, "ind0_Geo_surface_4T_4SepFill", None)
+        if outer_ids is None or len(outer_ids) == 0:
+            return
+        ids_arr = np.asarray(outer_ids, dtype=int)
+        
         # First call - set up the figure with two side-by-side plots
         plt.ion()
         
@@ -36,6 +74,9 @@ def on_step(part, step: int) -> None:
         cbar.set_label("Temperature (°C)", rotation=270, labelpad=20)
         ax_heat.set_xlabel("an_4T (circumferential index)")
         ax_heat.set_ylabel("ax_4T (axial index)")
+        # Two-line placeholder so the one-time layout reserves room for the
+        # per-step title set below
+        ax_heat.set_title("Outer Surface Temperature\nRange")
         
         # Right panel: time evolution of surface statistics
         ax_time = plt.subplot(1, 2, 2)
@@ -44,10 +85,67 @@ def on_step(part, step: int) -> None:
         ax_time.set_xlabel("Time (s)")
         ax_time.set_ylabel("Temperature (°C)")
         ax_time.set_title("Surface Temperature Evolution")
-        ax_time.legend(loc='best')
+        legend = ax_time.legend(loc='best')
         ax_time.grid(True, alpha=0.3)
+        # Span the whole simulation so the time axis never needs rescaling
+        ax_time.set_xlim(0, ip.nt * ip.dt)
+        
+        # Build coordinate mapping from node IDs to 2D grid positions; the
+        # surface nodes never change, so this is done once per figure
+        rows, ax_vals = _grid_positions(part.ax_4T[ids_arr])
+        cols, an_vals = _grid_positions(part.an_4T[ids_arr])
+        
+        # Store node IDs (-1 = no node) for annotation
+        node_map = np.full((ax_vals.size, an_vals.size), -1, dtype=int)
+        node_map[rows, cols] = ids_arr
+        
+        # Set the coordinate extent so axis labels match actual indices
+        heatmap.set_extent([
+            an_vals.min() - 0.5, 
+            an_vals.max() + 0.5,
+            ax_vals.min() - 0.5, 
+            ax_vals.max() + 0.5
+        ])
         
-        # Store all figure elements and data arrays for future updates
+        # Lock color scale to 15-80°C range for consistent thermal interpretation
+        heatmap.set_clim(15, 80)
+        
+        # Draw grid lines between cells to clearly separate nodes; these are
+        # line collections rather than an axis grid so they can be blitted
+        # on top of the heatmap image
+        x_edges = np.arange(an_vals.min() - 0.5, an_vals.max() + 1.5, 1)
+        y_edges = np.arange(ax_vals.min() - 0.5, ax_vals.max() + 1.5, 1)
+        ax_heat.set_xticks(an_vals)
+        ax_heat.set_yticks(ax_vals)
+        ax_heat.set_xticks(x_edges, minor=True)
+        ax_heat.set_yticks(y_edges, minor=True)
+        cell_edges = [
+            ax_heat.vlines(x_edges, y_edges[0], y_edges[-1],
+                           color='black', linestyle='-', linewidth=0.5),
+            ax_heat.hlines(y_edges, x_edges[0], x_edges[-1],
+                           color='black', linestyle='-', linewidth=0.5),
+        ]
+        ax_heat.set_xlim(x_edges[0], x_edges[-1])
+        ax_heat.set_ylim(y_edges[0], y_edges[-1])
+        
+        # Create one annotation per cell, reused and relabelled on each update
+        text_grid = np.empty(node_map.shape, dtype=object)
+        for i, ax_val in enumerate(ax_vals):
+            for j, an_val in enumerate(an_vals):
+                text_grid[i, j] = ax_heat.text(an_val, ax_val, '', 
+                       ha='center', va='center', color='black', 
+                       fontsize=6, weight='bold',
+                       bbox=dict(boxstyle='round,pad=0.3', facecolor='white', 
+                                edgecolor='none', alpha=0.8))
+        
+        # Artists that change on every update are excluded from normal draws
+        # and blitted over a cached background instead
+        animated: list[Artist] = [heatmap, *cell_edges, *text_grid.flat,
+                                  ax_heat.title, line_avg, line_max, legend]
+        for artist in animated:
+            artist.set_animated(True)
+        
+        # Store all figure elements, grid mappings and data arrays for future updates
         _FIGURE_STATE[id(part)] = {
             "fig": fig,
             "ax_heat": ax_heat,
@@ -55,76 +153,63 @@ def on_step(part, step: int) -> None:
             "heatmap": heatmap,
             "line_avg": line_avg,
             "line_max": line_max,
+            "outer_ids": ids_arr,
+            "ax_vals": ax_vals,
+            "an_vals": an_vals,
+            "rows": rows,
+            "cols": cols,
+            "node_map": node_map,
+            "heatmap_data": np.full(node_map.shape, np.nan, dtype=np.float32),
+            "text_grid": text_grid,
+            "animated": animated,
+            "background": None,
             "time_data": [],
             "avg_data": [],
             "max_data": [],
         }
         fig_state = _FIGURE_STATE[id(part)]
         
+        # Lay out once; per-step changes keep the same text extents
         plt.tight_layout()
         plt.show(block=False)
+        
+        # Re-cache the background whenever the full figure is redrawn
+        # (first draw, window resize, time axis rescale)
+        fig.canvas.mpl_connect("draw_event", _on_draw)
+        fig.canvas.draw()
     
-    # Build coordinate mapping from node IDs to 2D grid positions
-    ax_vals = np.unique(part.ax_4T[outer_ids])
-    an_vals = np.unique(part.an_4T[outer_ids])
-    
-    ax_index = {val: idx for idx, val in enumerate(ax_vals)}
-    an_index = {val: idx for idx, val in enumerate(an_vals)}
+    # Convert temperatures from Kelvin to Celsius for the current step,
+    # gathering only the monitored surface nodes
+    outer_temps = part.T_record[fig_state["outer_ids"], step] - 273.15
     
-    # Create 2D array for heatmap and store node IDs for annotation
-    heatmap_data = np.full((ax_vals.size, an_vals.size), np.nan)
-    node_map = {}
-    for node_id, node_temp in zip(outer_ids, outer_temps):
-        row = ax_index[part.ax_4T[node_id]]
-        col = an_index[part.an_4T[node_id]]
-        heatmap_data[row, col] = node_temp
-        node_map[(row, col)] = node_id
+    # Fill the preallocated heatmap grid with the current surface temperatures;
+    # cells without a node keep the NaN they were initialized with
+    node_map = fig_state["node_map"]
+    heatmap_data = fig_state["heatmap_data"]
+    heatmap_data[fig_state["rows"], fig_state["cols"]] = outer_temps
     
     # Update the heatmap with new temperature data
     heatmap = fig_state["heatmap"]
     heatmap.set_data(heatmap_data)
     
-    # Set the coordinate extent so axis labels match actual indices
-    heatmap.set_extent([
-        an_vals.min() - 0.5, 
-        an_vals.max() + 0.5,
-        ax_vals.min() - 0.5, 
-        ax_vals.max() + 0.5
-    ])
-    
-    # Draw grid lines between cells to clearly separate nodes
-    ax_heat = fig_state["ax_heat"]
-    ax_heat.set_xticks(an_vals)
-    ax_heat.set_yticks(ax_vals)
-    ax_heat.set_xticks(np.arange(an_vals.min() - 0.5, ax_vals.max() + 1.5, 1), minor=True)
-    ax_heat.set_yticks(np.arange(ax_vals.min() - 0.5, ax_vals.max() + 1.5, 1), minor=True)
-    ax_heat.grid(which='minor', color='black', linestyle='-', linewidth=0.5)
-    
-    # Clear previous text annotations
-    for txt in ax_heat.texts:
-        txt.remove()
-    
-    # Label each cell with node ID and temperature value
-    for i, ax_val in enumerate(ax_vals):
-        for j, an_val in enumerate(an_vals):
+    # Label each cell with node ID and temperature value, hiding empty cells
+    text_grid = fig_state["text_grid"]
+    for i in range(node_map.shape[0]):
+        for j in range(node_map.shape[1]):
+            txt = text_grid[i, j]
             temp_value = heatmap_data[i, j]
-            if not np.isnan(temp_value):
-                node_id = node_map[(i, j)]
-                label_text = f'Node: {node_id}\n{temp_value:.3f}°C'
-                ax_heat.text(an_val, ax_val, label_text, 
-                       ha='center', va='center', color='black', 
-                       fontsize=6, weight='bold',
-                       bbox=dict(boxstyle='round,pad=0.3', facecolor='white', 
-                                edgecolor='none', alpha=0.8))
-    
-    # Lock color scale to 15-80°C range for consistent thermal interpretation
-    heatmap.set_clim(15, 80)
+            if np.isnan(temp_value):
+                txt.set_visible(False)
+                continue
+            txt.set_text(f'Node: {node_map[i, j]}\n{temp_value:.3f}°C')
+            txt.set_visible(True)
     
     current_min = np.nanmin(heatmap_data)
     current_max = np.nanmax(heatmap_data)
     sim_time_s = step * ip.dt
     
     # Update title with current step, simulation time, and temperature range
+    ax_heat = fig_state["ax_heat"]
     ax_heat.set_title(
         f"Outer Surface Temperature (step {step}, t={sim_time_s:.1f}s)\n"
         f"Range: {current_min:.3f}°C - {current_max:.3f}°C"
@@ -144,21 +229,82 @@ def on_step(part, step: int) -> None:
     fig_state["line_avg"].set_data(fig_state["time_data"], fig_state["avg_data"])
     fig_state["line_max"].set_data(fig_state["time_data"], fig_state["max_data"])
     
-    # Rescale axes to fit all data points
-    ax_time.relim()
-    ax_time.autoscale_view()
-    
-    # Readjust layout to prevent title clipping as content changes
-    plt.tight_layout()
+    # Rescale the temperature axis only when new data falls outside it; this
+    # needs a full redraw, otherwise only the changing artists are blitted.
+    # The new limits leave headroom so steadily rising temperatures stay
+    # inside them for many updates
+    y_low, y_high = ax_time.get_ylim()
+    if current_avg < y_low or current_max_temp > y_high:
+        data_low = min(fig_state["avg_data"])
+        data_high = max(fig_state["max_data"])
+        headroom = max(5.0, 0.25 * (data_high - data_low))
+        ax_time.set_ylim(data_low - headroom, data_high + headroom)
+        fig_state["fig"].canvas.draw()
+    else:
+        _blit(fig_state)
     
     # Push updates to display
-    fig_state["fig"].canvas.draw()
     fig_state["fig"].canvas.flush_events()
-    plt.pause(0.01)
+
+
+def _grid_positions(keys: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Map node coordinates to heatmap grid positions.
+    
+    Returns each node's grid position and the coordinate of every grid line.
+    """
+    # ax_4T/an_4T are integer indices with unit spacing, so offsetting by the
+    # minimum gives the position directly with no sort
+    if np.array_equal(keys, np.round(keys)):
+        key_min = int(keys.min())
+        key_max = int(keys.max())
+        return (keys - key_min).astype(int), np.arange(key_min, key_max + 1)
+    # Otherwise the sorted unique values define the grid
+    vals = np.unique(keys)
+    return np.searchsorted(vals, keys), vals
+
+
+def _on_draw(event: DrawEvent) -> None:
+    """Cache the static figure background and redraw the animated artists."""
+    canvas = event.canvas
+    fig_state = next((state for state in _FIGURE_STATE.values()
+                      if state["fig"].canvas is canvas), None)
+    if fig_state is None:
+        return
+    # savefig renders animated artists too, so that draw is no background
+    if canvas.is_saving():
+        return
+    # Canvases that cannot blit cache nothing and get a full draw per update
+    if isinstance(canvas, _BlitCanvas):
+        fig_state["background"] = canvas.copy_from_bbox(fig_state["fig"].bbox)
+    _draw_animated(fig_state)
+
+
+def _draw_animated(fig_state: _FigureState) -> None:
+    """Draw every visible animated artist onto the canvas."""
+    fig = fig_state["fig"]
+    for artist in fig_state["animated"]:
+        if artist.get_visible():
+            fig.draw_artist(artist)
+
+
+def _blit(fig_state: _FigureState) -> None:
+    """Restore the cached background, redraw changing artists and blit."""
+    canvas = fig_state["fig"].canvas
+    if fig_state["background"] is None or not isinstance(canvas, _BlitCanvas):
+        # No background cached yet; a full draw caches one via _on_draw
+        canvas.draw()
+        return
+    canvas.restore_region(fig_state["background"])
+    _draw_animated(fig_state)
+    canvas.blit(fig_state["fig"].bbox)
 
 
 def cleanup():
     """Clean up resources and keep final plot visible."""
+    # Hand animated artists back to normal drawing so the final figure shows them
+    for fig_state in _FIGURE_STATE.values():
+        for artist in fig_state["animated"]:
+            artist.set_animated(False)
     _FIGURE_STATE.clear()
     plt.ioff()
     plt.show()
\ No newline at end of file
@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 import argparse
-from pathlib import Path
 
 
 def parse_cli_args() -> argparse.Namespace:
@@ -30,15 +29,8 @@ def apply_cli_overrides(inputs: dict, args: argparse.Namespace) -> None:
         args: Parsed command-line arguments
     """
     if args.profile_path is not None:
-        profile_path = Path(args.profile_path)
-        # Resolve relative paths by checking current directory first, then fallback to Examples
-        if not profile_path.is_absolute():
-            candidate = profile_path
-            if not candidate.exists():
-                fallback = Path("pyecn/Examples/Profiles") / profile_path
-                candidate = fallback if fallback.exists() else profile_path
-            profile_path = candidate
-        inputs["operating_conditions"]["I_ext_fpath"] = str(profile_path)
+        # Stored as given; the profile loader searches for relative paths
+        inputs["operating_conditions"]["I_ext_fpath"] = args.profile_path
     
     if args.dt is not None:
         inputs["operating_conditions"]["dt"] = args.dt